@@ -0,0 +1,401 @@
+"""Offline load test for the demo crews.
+
+Runs N crews concurrently against the local mock LLM (`mock_llm_server.py`),
+the StdIO math server and the streamable-HTTP hello server, then reports
+throughput, crew setup and kickoff latency percentiles, peak RSS per crew (with
+and without the MCP server subprocesses it started) and the file-descriptor and
+subprocess counts observed while each crew was running.
+
+Each crew runs in its own freshly spawned process so its peak RSS is measured
+in isolation. CrewAI and the scenario's modules are imported before the clock
+starts, so setup time covers adapter/server startup and crew construction, and
+kickoff time covers `Crew.kickoff` alone. Run from the repository root:
+
+    python3 load_testing/crew_load_test.py --scenario mathematician --crews 20 --concurrency 4
+"""
+
+import argparse
+import json
+import math
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+from mock_llm_server import serve
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MATH_SERVER = REPO_ROOT / "servers" / "math_stdio_server.py"
+HELLO_SERVER = REPO_ROOT / "servers" / "hello_http_server.py"
+HELLO_URL = "http://localhost:8001/mcp"
+SCAFFOLDS = REPO_ROOT / "scaffolding_approach_examples"
+SCRIPTS = REPO_ROOT / "script_approach_examples"
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+SCENARIOS = ["mathematician", "context7", "stdio_script", "http_script", "multi_script"]
+
+
+def _math_params():
+    from mcp import StdioServerParameters
+
+    return StdioServerParameters(
+        command=sys.executable,
+        args=[str(MATH_SERVER)],
+        env={"UV_PYTHON": "3.12", **os.environ},
+    )
+
+
+def _hello_params():
+    return {"url": HELLO_URL, "transport": "streamable-http"}
+
+
+def import_scenario(scenario: str) -> None:
+    """Import everything a scenario needs, so cold imports stay out of the timings."""
+    import crewai  # noqa: F401
+    import crewai_tools  # noqa: F401
+    import mcp  # noqa: F401
+
+    if scenario == "mathematician":
+        sys.path.insert(0, str(SCAFFOLDS / "mathematician_project" / "src"))
+        import mathematician_project.crew  # noqa: F401
+    elif scenario == "context7":
+        sys.path.insert(0, str(SCAFFOLDS / "crewai_context7_mcp" / "src"))
+        import crewai_context7_mcp.crew  # noqa: F401
+    elif scenario == "stdio_script":
+        sys.path.insert(0, str(SCRIPTS))
+        import inprocess_mcp  # noqa: F401
+
+
+def _script_crew(adapter, role, goal, description, inputs):
+    """Mirror the script-approach demos without their interactive prompts."""
+    from crewai import Agent, Crew, Task
+
+    try:
+        agent = Agent(role=role, goal=goal, backstory=goal, tools=adapter.tools, verbose=False)
+        task = Task(description=description, expected_output="The answer.", agent=agent)
+        return Crew(agents=[agent], tasks=[task], verbose=False), inputs, adapter.stop
+    except Exception:
+        adapter.stop()
+        raise
+
+
+def setup_scenario(scenario: str):
+    """Start the scenario's servers and build its crew.
+
+    Returns `(crew, inputs, close)`; call `close()` once the kickoff is done.
+    """
+    if scenario == "mathematician":
+        from mathematician_project.crew import MathematicianProject
+
+        MathematicianProject.mcp_server_params = [_math_params()]
+        MathematicianProject.math_server = str(MATH_SERVER)
+        return MathematicianProject().crew(), {"problem": "power(2.25, 2)"}, lambda: None
+
+    if scenario == "context7":
+        # Same crew shape as the Context7 scaffold, rebound to the local hello
+        # server so no Smithery API key or network round trip is involved.
+        from crewai_context7_mcp.crew import CrewaiContext7Mcp
+
+        CrewaiContext7Mcp.mcp_server_params = _hello_params()
+        project = CrewaiContext7Mcp()
+        try:
+            crew = project.crew()
+        except Exception:
+            project.close()
+            raise
+        return crew, {"library_name": "/crewaiinc/crewai", "topic": "load test"}, project.close
+
+    if scenario == "stdio_script":
+        from inprocess_mcp import InProcessServerAdapter
+
+        # StdIO unless the worker set MCP_IN_PROCESS for --in-process.
+        adapter = InProcessServerAdapter(f"{MATH_SERVER}:mcp")
+        adapter.start()
+        return _script_crew(
+            adapter, "Mathematician", "Perform mathematical operations.",
+            "Solve the math {problem} given to you by the user.", {"problem": "power(2.25, 2)"},
+        )
+
+    if scenario == "http_script":
+        from crewai_tools import MCPServerAdapter
+
+        return _script_crew(
+            MCPServerAdapter(_hello_params()), "Hello World", "Greet the user.",
+            "Greet the {user}.", {"user": "Load Test"},
+        )
+
+    if scenario == "multi_script":
+        from crewai_tools import MCPServerAdapter
+
+        return _script_crew(
+            MCPServerAdapter([_hello_params(), _math_params()]), "Assistant", "Greet the user and do math.",
+            "Greet the {user} and solve {problem}.", {"user": "Load Test", "problem": "power(2.25, 2)"},
+        )
+
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def _count_fds() -> int:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except FileNotFoundError:
+        return -1
+
+
+def _descendants() -> set[int] | None:
+    """PIDs of live descendant processes of this worker (Linux /proc only)."""
+    try:
+        entries = [e for e in os.listdir("/proc") if e.isdigit()]
+    except FileNotFoundError:
+        return None
+    parents = {}
+    for pid in entries:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        parents[int(pid)] = int(stat.rsplit(")", 1)[1].split()[1])
+    descendants, frontier = set(), {os.getpid()}
+    while frontier:
+        frontier = {pid for pid, ppid in parents.items() if ppid in frontier}
+        descendants |= frontier
+    return descendants
+
+
+def _rss_mb(pid: int) -> float:
+    """Current resident set size of a process in MiB (Linux /proc only)."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE / 1024 ** 2
+    except (OSError, IndexError, ValueError):
+        return 0.0  # The process exited between listing and reading.
+
+
+def _prepare_worker(scenario: str, llm_base_url: str, in_process: bool) -> None:
+    os.environ.update({
+        "MCP_IN_PROCESS": "true" if in_process else "false",
+        "MODEL": "openai/mock-llm",
+        "OPENAI_API_KEY": "mock",
+        "OPENAI_API_BASE": llm_base_url,
+        "OPENAI_BASE_URL": llm_base_url,
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true",
+    })
+    import_scenario(scenario)
+
+
+def _worker(scenario: str, sample_interval: float) -> dict:
+    peak = {"fds": _count_fds(), "children": 0, "total_rss_mb": 0.0}
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(sample_interval):
+            peak["fds"] = max(peak["fds"], _count_fds())
+            children = _descendants()
+            if children is None:
+                peak["children"] = -1
+                continue
+            peak["children"] = max(peak["children"], len(children))
+            # The worker plus the StdIO/HTTP servers it started, so StdIO runs
+            # are comparable with --in-process runs that host the server.
+            total = _rss_mb(os.getpid()) + sum(_rss_mb(pid) for pid in children)
+            peak["total_rss_mb"] = max(peak["total_rss_mb"], total)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+
+    error = setup_s = kickoff_s = None
+    try:
+        start = time.perf_counter()
+        crew, inputs, close = setup_scenario(scenario)
+        setup_s = time.perf_counter() - start
+        try:
+            start = time.perf_counter()
+            crew.kickoff(inputs=inputs)
+            kickoff_s = time.perf_counter() - start
+        finally:
+            close()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    done.set()
+    sampler.join()
+
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    rss_unit = 1024 if sys.platform != "darwin" else 1024 ** 2
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / rss_unit
+    if peak["children"] < 0:
+        # No /proc: fall back to the largest child that has been reaped.
+        peak["total_rss_mb"] = peak_rss_mb + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / rss_unit
+    return {
+        "setup_s": setup_s,
+        "kickoff_s": kickoff_s,
+        "peak_rss_mb": peak_rss_mb,
+        "peak_total_rss_mb": max(peak_rss_mb, peak["total_rss_mb"]),
+        "peak_fds": peak["fds"],
+        "peak_subprocesses": peak["children"],
+        "error": error,
+    }
+
+
+def _crew_process(conn, scenario: str, llm_base_url: str, sample_interval: float, in_process: bool) -> None:
+    try:
+        _prepare_worker(scenario, llm_base_url, in_process)
+    except Exception as e:
+        conn.send(("setup_error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ok", _worker(scenario, sample_interval)))
+
+
+def run_crew(scenario: str, llm_base_url: str, sample_interval: float, in_process: bool) -> dict:
+    """Run one crew in a fresh spawned process and return its measurements.
+
+    A new process per crew keeps `ru_maxrss` per crew on every supported
+    Python (`ProcessPoolExecutor(max_tasks_per_child=...)` needs 3.11).
+    Import failures are raised instead of being counted as crew errors.
+    """
+    ctx = get_context("spawn")
+    receiver, sender = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_crew_process, args=(sender, scenario, llm_base_url, sample_interval, in_process))
+    proc.start()
+    sender.close()
+    try:
+        status, payload = receiver.recv()
+    except EOFError:
+        status, payload = "setup_error", "worker exited before reporting"
+    finally:
+        receiver.close()
+        proc.join()
+    if status != "ok":
+        raise RuntimeError(f"Crew worker failed before the crew started: {payload} (exit code {proc.exitcode})")
+    return payload
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; `values` must be non-empty.
+
+    >>> percentile([1, 2, 3, 4, 5], 50)
+    3
+    >>> percentile(range(1, 31), 95)
+    29
+    >>> percentile(range(1, 101), 99)
+    99
+    >>> percentile([7], 99)
+    7
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(results: list[dict], wall_time: float) -> dict:
+    ok = [r for r in results if r["error"] is None]
+    setups = [r["setup_s"] for r in ok]
+    kickoffs = [r["kickoff_s"] for r in ok]
+    summary = {
+        "crews": len(results),
+        "errors": len(results) - len(ok),
+        "wall_time_s": round(wall_time, 3),
+        "throughput_crews_per_s": round(len(ok) / wall_time, 3) if wall_time else 0.0,
+    }
+    if ok:
+        for name, values in (("setup", setups), ("kickoff", kickoffs)):
+            summary.update({
+                f"{name}_p50_s": round(percentile(values, 50), 4),
+                f"{name}_p95_s": round(percentile(values, 95), 4),
+                f"{name}_p99_s": round(percentile(values, 99), 4),
+                f"{name}_mean_s": round(statistics.fmean(values), 4),
+            })
+        summary.update({
+            "peak_rss_mb_per_crew_max": round(max(r["peak_rss_mb"] for r in ok), 1),
+            "peak_rss_mb_per_crew_mean": round(statistics.fmean(r["peak_rss_mb"] for r in ok), 1),
+            "peak_rss_mb_with_servers_per_crew_max": round(max(r["peak_total_rss_mb"] for r in ok), 1),
+            "peak_rss_mb_with_servers_per_crew_mean": round(statistics.fmean(r["peak_total_rss_mb"] for r in ok), 1),
+            "peak_fds_per_crew_max": max(r["peak_fds"] for r in ok),
+            "peak_subprocesses_per_crew_max": max(r["peak_subprocesses"] for r in ok),
+        })
+    summary["first_errors"] = [r["error"] for r in results if r["error"]][:3]
+    return summary
+
+
+def _port_open(host: str, port: int) -> bool:
+    with socket.socket() as s:
+        s.settimeout(0.2)
+        return s.connect_ex((host, port)) == 0
+
+
+def start_hello_server() -> subprocess.Popen | None:
+    """Start the hello HTTP server unless something already listens on :8001."""
+    if _port_open("localhost", 8001):
+        return None
+    proc = subprocess.Popen([sys.executable, str(HELLO_SERVER)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while not _port_open("localhost", 8001):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            raise RuntimeError("hello_http_server.py did not start on port 8001")
+        time.sleep(0.1)
+    return proc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the CrewAI MCP demo crews.")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="mathematician")
+    parser.add_argument("--crews", type=int, default=10, help="Total number of crew runs")
+    parser.add_argument("--concurrency", type=int, default=4, help="Crews running at the same time")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--llm-port", type=int, default=8010)
+    parser.add_argument("--script", help="JSON tool-call script for the mock LLM")
+    parser.add_argument("--in-process", action="store_true", help="Mount the math server in-process (mathematician and stdio_script scenarios)")
+    parser.add_argument("--sample-interval", type=float, default=0.05, help="Seconds between fd/subprocess samples")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    script = None
+    if args.script:
+        with open(args.script) as f:
+            script = json.load(f)
+
+    llm_server = serve(port=args.llm_port, script=script, latency_ms=args.llm_latency_ms, jitter_ms=args.llm_jitter_ms)
+    llm_base_url = f"http://localhost:{args.llm_port}/v1"
+    hello_proc = start_hello_server() if args.scenario in ("context7", "http_script", "multi_script") else None
+
+    results = []
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = [pool.submit(run_crew, args.scenario, llm_base_url, args.sample_interval, args.in_process) for _ in range(args.crews)]
+            try:
+                for future in as_completed(futures):
+                    results.append(future.result())
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
+    finally:
+        wall_time = time.perf_counter() - start
+        llm_server.shutdown()
+        if hello_proc:
+            hello_proc.terminate()
+            hello_proc.wait()
+
+    summary = summarize(results, wall_time)
+    summary.update({"scenario": args.scenario, "concurrency": args.concurrency, "llm_requests": llm_server.llm.requests})
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>40}: {value}")
+
+
+if __name__ == "__main__":
+    main()
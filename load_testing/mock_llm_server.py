@@ -0,0 +1,156 @@
+"""A deterministic, OpenAI-compatible mock LLM for offline load tests.
+
+The server answers `/v1/chat/completions` with scripted ReAct turns so CrewAI
+agents exercise their MCP tools exactly as they would against a real model:
+the first turns emit `Action` / `Action Input` for each scripted tool call that
+the agent actually has, then a `Final Answer` once every call has produced an
+observation. Latency is configurable so the harness can model a slow provider.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Tool calls emitted in order, keyed by tool name. A call is only emitted when
+# the agent's system prompt lists that tool, so one script serves every crew.
+DEFAULT_SCRIPT = [
+    {"tool": "power", "args": {"base": 2.25, "exponent": 2}},
+    {"tool": "hello", "args": {"name": "Load Test"}},
+]
+
+TOOL_NAME_PATTERN = re.compile(r"^Tool Name: (.+?)$", re.MULTILINE)
+
+
+def _message_text(message: dict) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content
+
+
+def next_turn(messages: list[dict], script: list[dict]) -> str:
+    """Return the next scripted assistant turn for a chat transcript."""
+    transcript = "\n".join(_message_text(m) for m in messages)
+    available = set(TOOL_NAME_PATTERN.findall(transcript))
+    calls = [call for call in script if call["tool"] in available]
+
+    # The opening system/user prompt spells out the ReAct format (including an
+    # "Observation:" line), so only count observations in the turns after it.
+    first_user = next((i for i, m in enumerate(messages) if m.get("role") == "user"), len(messages))
+    observations = sum(_message_text(m).count("Observation:") for m in messages[first_user + 1:])
+
+    if observations < len(calls):
+        call = calls[observations]
+        return (
+            f"Thought: I should use the {call['tool']} tool.\n"
+            f"Action: {call['tool']}\n"
+            f"Action Input: {json.dumps(call['args'])}"
+        )
+    return "Thought: I now know the final answer\nFinal Answer: Mock answer for the load test."
+
+
+class MockLLM:
+    """Holds the script, latency model and request counters."""
+
+    def __init__(self, script: list[dict], latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0):
+        self.script = script
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def delay(self) -> float:
+        with self._lock:
+            self.requests += 1
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def completion(self, body: dict) -> dict:
+        text = next_turn(body.get("messages", []), self.script)
+        return {
+            "id": f"chatcmpl-mock-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock-llm"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+
+def make_handler(llm: MockLLM):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            time.sleep(llm.delay())
+            payload = json.dumps(llm.completion(body)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                payload = json.dumps({"object": "list", "data": [{"id": "mock-llm", "object": "model"}]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            else:
+                self.send_error(404)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host: str = "localhost", port: int = 8010, script: list[dict] | None = None,
+          latency_ms: float = 0.0, jitter_ms: float = 0.0) -> ThreadingHTTPServer:
+    """Start the mock LLM on a background thread and return the server."""
+    llm = MockLLM(script or DEFAULT_SCRIPT, latency_ms=latency_ms, jitter_ms=jitter_ms)
+    server = ThreadingHTTPServer((host, port), make_handler(llm))
+    server.daemon_threads = True
+    server.llm = llm
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean delay added to every completion")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter around the mean delay")
+    parser.add_argument("--script", help="JSON file with a list of {\"tool\": ..., \"args\": {...}} calls")
+    args = parser.parse_args()
+
+    script = None
+    if args.script:
+        with open(args.script) as f:
+            script = json.load(f)
+
+    server = serve(args.host, args.port, script, args.latency_ms, args.jitter_ms)
+    print(f"Mock LLM listening on http://{args.host}:{args.port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -2,7 +2,10 @@ from typing import List, Union
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.tools import BaseTool
 from crewai_tools import MCPServerAdapter
+from crewai_context7_mcp.tools.coalescing import coalesce
+from crewai_context7_mcp.tools.deadlines import DeadlineServerAdapter
 from typing import List
 import os
 
@@ -19,12 +22,40 @@ class CrewaiContext7Mcp():
         "transport": "streamable-http",
     }
 
+    # Per-tool time budget (seconds) and per-task budget for each agent; the
+    # adapter caps and cancels MCP calls at whichever runs out first
+    tool_timeout: float = 60
+    max_execution_time: int = 300
+
+    _deadline_adapter: DeadlineServerAdapter | None = None
+
+    def get_deadline_tools(self, *tool_names: str) -> List[BaseTool]:
+        """Like get_mcp_tools(), but calls are cancelled past their tool or task budget and docs lookups are hedged."""
+        if self._deadline_adapter is None:
+            self._deadline_adapter = DeadlineServerAdapter(
+                self.mcp_server_params,
+                tool_timeout=self.tool_timeout,
+                hedge_tools={"resolve-library-id", "get-library-docs"},
+                hedge_min_samples=5,
+                hedge_initial_delay=15,
+                task_budgets=True,
+            )
+            self._deadline_adapter.start()
+        return [tool for tool in self._deadline_adapter.tools if not tool_names or tool.name in tool_names]
+
+    def close(self) -> None:
+        """Disconnect from the MCP server; call once the crew is done, even if it failed."""
+        if self._deadline_adapter is not None:
+            self._deadline_adapter.stop()
+            self._deadline_adapter = None
+
     @agent
     def researcher(self) -> Agent:
         return Agent(
             config=self.agents_config['researcher'], # type: ignore[index]
             verbose=True,
-            tools=self.get_mcp_tools() # GET
+            max_execution_time=self.max_execution_time,
+            tools=coalesce(self.get_deadline_tools(), server="context7") # GET
         )
     
     @agent
@@ -32,7 +63,8 @@ class CrewaiContext7Mcp():
         return Agent(
             config=self.agents_config['answer_generator'], # type: ignore[index]
             verbose=True,
-            tools=self.get_mcp_tools("get-library-docs") 
+            max_execution_time=self.max_execution_time,
+            tools=coalesce(self.get_deadline_tools("get-library-docs"), server="context7")
         )
 
 
@@ -5,6 +5,7 @@ import warnings
 from datetime import datetime
 
 from crewai_context7_mcp.crew import CrewaiContext7Mcp
+from crewai_context7_mcp.tools.coalescing import default_group
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="pydantic")
@@ -19,10 +20,14 @@ def run():
         'topic': input('Enter a question: '),
     }
     
+    crew = CrewaiContext7Mcp()
     try:
-        CrewaiContext7Mcp().crew().kickoff(inputs=inputs)
+        crew.crew().kickoff(inputs=inputs)
+        print(f"MCP calls: {default_group.stats()}")
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
+    finally:
+        crew.close()
 
 
 def train():
@@ -32,21 +37,27 @@ def train():
     inputs = {
         "topic": "CrewAI Flows",
     }
+    crew = CrewaiContext7Mcp()
     try:
-        CrewaiContext7Mcp().crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
+        crew.crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
 
     except Exception as e:
         raise Exception(f"An error occurred while training the crew: {e}")
+    finally:
+        crew.close()
 
 def replay():
     """
     Replay the crew execution from a specific task.
     """
+    crew = CrewaiContext7Mcp()
     try:
-        CrewaiContext7Mcp().crew().replay(task_id=sys.argv[1])
+        crew.crew().replay(task_id=sys.argv[1])
 
     except Exception as e:
         raise Exception(f"An error occurred while replaying the crew: {e}")
+    finally:
+        crew.close()
 
 def test():
     """
@@ -56,8 +67,11 @@ def test():
         "topic": "CrewAI Flows",
     }
     
+    crew = CrewaiContext7Mcp()
     try:
-        CrewaiContext7Mcp().crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs)
+        crew.crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs)
 
     except Exception as e:
         raise Exception(f"An error occurred while testing the crew: {e}")
+    finally:
+        crew.close()
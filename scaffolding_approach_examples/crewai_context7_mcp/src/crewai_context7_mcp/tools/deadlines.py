@@ -0,0 +1,341 @@
+"""Per-tool deadlines, cancellation and hedged requests for the Context7 crew.
+
+Trimmed copy of `script_approach_examples/deadline_mcp.py`, which is the source
+of truth: it keeps only the streamable-HTTP transport this crew connects with.
+Port fixes there first.
+"""
+
+import asyncio
+import concurrent.futures
+import math
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from contextlib import AsyncExitStack
+from typing import Any, Iterable, List, Type
+
+from crewai.tools import BaseTool
+from mcp import ClientSession, types
+from mcp.client.streamable_http import streamablehttp_client
+from mcpadapt.utils.modeling import create_model_from_json_schema, resolve_refs_and_remove_defs
+from pydantic import BaseModel, ConfigDict
+
+
+def _transport(params: dict[str, Any]):
+    kwargs = {k: v for k, v in params.items() if k not in ("url", "transport")}
+    return streamablehttp_client(params["url"], **kwargs)
+
+
+def _result_text(result: types.CallToolResult) -> str:
+    # Same shape MCPServerAdapter returns for tool results.
+    if len(result.content) == 1:
+        return result.content[0].text
+    return str([content.text for content in result.content if hasattr(content, "text")])
+
+
+class DeadlineTool(BaseTool):
+    """A CrewAI tool whose calls go through `DeadlineServerAdapter.call`."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    description: str
+    args_schema: Type[BaseModel]
+    adapter: Any
+
+    def _run(self, **kwargs: Any) -> Any:
+        return self.adapter.call(self.name, {k: v for k, v in kwargs.items() if v is not None})
+
+
+class DeadlineServerAdapter:
+    """Context manager with the same shape as `MCPServerAdapter`.
+
+    Args:
+        server_params: Streamable-HTTP server parameters or a list of them.
+        tool_timeout: Time budget in seconds for each tool call.
+        hedge_tools: Names of tools that are safe to send twice. Tools whose
+            MCP annotations mark them read-only or idempotent are included.
+        hedge_percentile: Latency percentile after which a hedge is sent.
+        hedge_min_samples: Calls to observe before hedging with the percentile.
+        hedge_initial_delay: Hedge delay until enough samples exist; `None`
+            disables hedging until then.
+        task_budgets: Apply each task's agent `max_execution_time` to the tool
+            calls made for it, using CrewAI's task events. Assumes the adapter
+            serves one task at a time, as in a sequential crew.
+    """
+
+    def __init__(
+        self,
+        server_params: dict[str, Any] | list[dict[str, Any]],
+        tool_timeout: float = 60.0,
+        hedge_tools: Iterable[str] = (),
+        hedge_percentile: float = 95,
+        hedge_min_samples: int = 20,
+        hedge_initial_delay: float | None = None,
+        connect_timeout: float = 30.0,
+        task_budgets: bool = False,
+    ):
+        self.server_params = server_params if isinstance(server_params, list) else [server_params]
+        self.tool_timeout = tool_timeout
+        self.hedge_tools = set(hedge_tools)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_initial_delay = hedge_initial_delay
+        self.connect_timeout = connect_timeout
+        self.task_budgets = task_budgets
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stop: asyncio.Event | None = None
+        self._runner: Any = None
+        self._sessions: dict[str, ClientSession] = {}
+        self._latencies: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=256))
+        self._tools: List[BaseTool] = []
+        self._in_flight: set[asyncio.Task] = set()
+        self._task_deadline: float | None = None
+        self.counters = {
+            "calls": 0, "timeouts": 0, "cancelled": 0, "hedged": 0, "hedge_wins": 0, "over_task_budget": 0,
+        }
+
+    # -- Lifecycle ------------------------------------------------------------
+
+    def start(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+        ready = threading.Event()
+        self._runner = asyncio.run_coroutine_threadsafe(self._serve(ready), self._loop)
+        if not ready.wait(self.connect_timeout):
+            self.stop()
+            raise TimeoutError(f"MCP servers did not connect within {self.connect_timeout}s")
+        if self._runner.done():
+            self._runner.result()
+        if self.task_budgets:
+            self._listen_for_tasks()
+
+    async def _serve(self, ready: threading.Event) -> None:
+        # Transports use anyio task groups, which must be entered and exited
+        # in the same task, so one task owns every connection until stop().
+        self._stop = asyncio.Event()
+        try:
+            async with AsyncExitStack() as stack:
+                for params in self.server_params:
+                    read, write, *_ = await stack.enter_async_context(_transport(params))
+                    session = await stack.enter_async_context(ClientSession(read, write))
+                    await session.initialize()
+                    for tool in (await session.list_tools()).tools:
+                        self._add_tool(session, tool)
+                ready.set()
+                await self._stop.wait()
+        finally:
+            ready.set()
+
+    def _add_tool(self, session: ClientSession, tool: types.Tool) -> None:
+        annotations = tool.annotations
+        if annotations and (annotations.readOnlyHint or annotations.idempotentHint):
+            self.hedge_tools.add(tool.name)
+        self._sessions[tool.name] = session
+        self._tools.append(
+            DeadlineTool(
+                name=tool.name,
+                description=tool.description or "",
+                args_schema=create_model_from_json_schema(resolve_refs_and_remove_defs(tool.inputSchema)),
+                adapter=self,
+            )
+        )
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        if self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._runner is not None:
+            try:
+                self._runner.result(timeout=10)
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._loop = None
+
+    @property
+    def tools(self) -> List[BaseTool]:
+        return self._tools
+
+    def __enter__(self) -> List[BaseTool]:
+        self.start()
+        return self.tools
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    # -- Task budgets ---------------------------------------------------------
+
+    def begin_task(self, budget: float | None) -> None:
+        """Start a task budget: later calls must finish within `budget` seconds."""
+        self._task_deadline = None if budget is None else time.monotonic() + budget
+
+    def end_task(self, failed: bool = False) -> None:
+        """End the current task budget.
+
+        When the task failed (for example on CrewAI's `max_execution_time`), its
+        agent may still be running in an abandoned thread, so calls in flight are
+        cancelled and an expired deadline stays in place until the next task.
+        """
+        if not failed:
+            self._task_deadline = None
+            return
+        if self._task_deadline is not None:
+            self._task_deadline = min(self._task_deadline, time.monotonic())
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel_in_flight)
+
+    def _cancel_in_flight(self) -> None:
+        for task in list(self._in_flight):
+            task.cancel()
+
+    def _uses(self, agent: Any) -> bool:
+        """Whether `agent` has one of this adapter's tools, possibly wrapped."""
+        for tool in getattr(agent, "tools", None) or []:
+            while tool is not None:
+                if getattr(tool, "adapter", None) is self:
+                    return True
+                tool = getattr(tool, "tool", None)
+        return False
+
+    def _listen_for_tasks(self) -> None:
+        from crewai.utilities.events import (
+            TaskCompletedEvent,
+            TaskFailedEvent,
+            TaskStartedEvent,
+            crewai_event_bus,
+        )
+
+        # The event bus keeps handlers for the life of the process; a weak
+        # reference lets stopped adapters be collected.
+        ref = weakref.ref(self)
+
+        def task_agent(source: Any, event: Any) -> Any:
+            adapter = ref()
+            task = getattr(event, "task", None) or source
+            agent = getattr(task, "agent", None)
+            if adapter is None or adapter._loop is None or not adapter._uses(agent):
+                return None, None
+            return adapter, agent
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source: Any, event: Any) -> None:
+            adapter, agent = task_agent(source, event)
+            if adapter is not None:
+                adapter.begin_task(getattr(agent, "max_execution_time", None))
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source: Any, event: Any) -> None:
+            adapter, _ = task_agent(source, event)
+            if adapter is not None:
+                adapter.end_task()
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source: Any, event: Any) -> None:
+            adapter, _ = task_agent(source, event)
+            if adapter is not None:
+                adapter.end_task(failed=True)
+
+    # -- Tool calls -----------------------------------------------------------
+
+    def call(self, name: str, arguments: dict[str, Any]) -> str:
+        """Run a tool call on the adapter's loop, honouring its deadline."""
+        return self._call_with_budget(name, arguments, self.tool_timeout)
+
+    def _call_with_budget(self, name: str, arguments: dict[str, Any], timeout: float) -> str:
+        budget = f"its {timeout}s budget"
+        deadline = self._task_deadline
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.counters["over_task_budget"] += 1
+                raise TimeoutError(f"MCP tool '{name}' was not called: the task's time budget is used up")
+            if remaining < timeout:
+                timeout, budget = remaining, f"the task's remaining {remaining:.1f}s"
+        future = asyncio.run_coroutine_threadsafe(self._call(name, arguments, timeout, budget), self._loop)
+        try:
+            return _result_text(future.result())
+        except concurrent.futures.CancelledError:
+            raise TimeoutError(f"MCP tool '{name}' was cancelled because its task ended") from None
+
+    async def _call(self, name: str, arguments: dict[str, Any], timeout: float, budget: str) -> types.CallToolResult:
+        self.counters["calls"] += 1
+        task = asyncio.current_task()
+        self._in_flight.add(task)
+        try:
+            return await asyncio.wait_for(self._dispatch(name, arguments), timeout)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            raise TimeoutError(f"MCP tool '{name}' did not finish within {budget} and was cancelled")
+        finally:
+            self._in_flight.discard(task)
+
+    async def _dispatch(self, name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+        delay = self._hedge_delay(name) if name in self.hedge_tools else None
+        if delay is None:
+            return await self._call_once(name, arguments)
+
+        first = asyncio.ensure_future(self._call_once(name, arguments))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return first.result()
+
+            hedge = asyncio.ensure_future(self._call_once(name, arguments))
+            self.counters["hedged"] += 1
+            pending = {first, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.counters["hedge_wins"] += task is hedge
+                        return task.result()
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _call_once(self, name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+        session = self._sessions[name]
+        start = self._loop.time()
+        # send_request() takes the next id before its first await, so reading
+        # it here, with no await in between, gives this call's request id.
+        request_id = session._request_id
+        try:
+            result = await session.call_tool(name, arguments)
+        except asyncio.CancelledError:
+            self.counters["cancelled"] += 1
+            self._loop.create_task(self._cancel_on_server(session, request_id))
+            raise
+        self._latencies[name].append(self._loop.time() - start)
+        return result
+
+    async def _cancel_on_server(self, session: ClientSession, request_id: int) -> None:
+        notification = types.CancelledNotification(
+            params=types.CancelledNotificationParams(requestId=request_id, reason="Client deadline exceeded")
+        )
+        try:
+            await session.send_notification(types.ClientNotification(notification))
+        except Exception:
+            pass  # The connection may already be closing.
+
+    def _hedge_delay(self, name: str) -> float | None:
+        samples = sorted(self._latencies[name])
+        if len(samples) < self.hedge_min_samples:
+            return self.hedge_initial_delay
+        return samples[max(0, math.ceil(self.hedge_percentile / 100 * len(samples)) - 1)]
+
+    def stats(self) -> dict[str, Any]:
+        """Call, timeout, cancellation and hedging counters plus current hedge delays."""
+        return {
+            **self.counters,
+            "hedge_delay_s": {name: self._hedge_delay(name) for name in sorted(self.hedge_tools)},
+        }
@@ -1,10 +1,14 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.tools import BaseTool
 from typing import List, Union
 from mcp import StdioServerParameters
+from mathematician_project.tools.inprocess import in_process_enabled, in_process_tools, load_server
 import os
 
+MATH_SERVER = "../servers/math_stdio_server.py"
+
 @CrewBase
 class MathematicianProject():
     """MathematicianProject crew"""
@@ -15,17 +19,31 @@ class MathematicianProject():
     mcp_server_params: Union[list[StdioServerParameters | dict[str, str]], StdioServerParameters, dict[str, str]] = [
         StdioServerParameters(
             command="python3",
-            args=["../servers/math_stdio_server.py"],
+            args=[MATH_SERVER],
             env={"UV_PYTHON": "3.12", **os.environ},
         )
     ]
 
+    # Mounted in-process unless MCP_IN_PROCESS=false, which falls back to mcp_server_params over StdIO
+    math_server: str = MATH_SERVER
+
+    def get_math_tools(self, *tool_names: str) -> List[BaseTool]:
+        """get_mcp_tools() with in-process mounting.
+
+        @CrewBase defines get_mcp_tools() on the subclass it generates, so a
+        crew cannot override it; agents call this instead.
+        """
+        if not in_process_enabled():
+            return self.get_mcp_tools(*tool_names)
+        tools = in_process_tools(load_server(f"{self.math_server}:mcp"))
+        return [tool for tool in tools if not tool_names or tool.name in tool_names]
+
     @agent
     def mathematician(self) -> Agent:
         return Agent(
             config=self.agents_config['mathematician'], # type: ignore[index]
             verbose=True,
-            tools=self.get_mcp_tools()
+            tools=self.get_math_tools()
         )
 
     @task
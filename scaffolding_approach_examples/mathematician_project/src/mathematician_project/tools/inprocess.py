@@ -0,0 +1,117 @@
+"""Mount the local math server in the crew's process.
+
+Copy of `script_approach_examples/inprocess_mcp.py` without its
+`InProcessServerAdapter`, which is the source of truth. Port fixes there first.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import inspect
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Type
+
+import pydantic_core
+from crewai.tools import BaseTool
+from pydantic import BaseModel, ConfigDict
+
+
+def in_process_enabled() -> bool:
+    """In-process mounting is on unless `MCP_IN_PROCESS` is set to a false value."""
+    return os.getenv("MCP_IN_PROCESS", "true").lower() not in ("0", "false", "no")
+
+
+def load_server(import_path: str) -> Any:
+    """Load a FastMCP object from `package.module:attr` or `path/to/file.py:attr`.
+
+    The attribute defaults to `mcp`, the name used by the servers in this repo.
+    """
+    target, _, attr = import_path.partition(":")
+    if target.endswith(".py"):
+        path = Path(target).resolve()
+        module_name = path.stem
+        module = sys.modules.get(module_name)
+        if module is None or getattr(module, "__file__", None) != str(path):
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            module = importlib.util.module_from_spec(spec)
+            # Let the server import its sibling modules, as `python3 path/to/file.py`
+            # would, but only while it loads: the servers directory must neither
+            # shadow client modules nor be shadowed by them. Sibling helpers use
+            # `mcp_`-prefixed names to stay clear of client module names.
+            sys.path.insert(0, str(path.parent))
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                sys.path.remove(str(path.parent))
+            sys.modules[module_name] = module
+    else:
+        module = importlib.import_module(target)
+    return getattr(module, attr or "mcp")
+
+
+def _to_text(result: Any) -> str:
+    """Convert a tool's return value the way FastMCP does for text content."""
+    if isinstance(result, str):
+        return result
+    return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+
+
+async def _awaited(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _resolve(result: Any) -> Any:
+    """Wait for an async tool's result from synchronous `_run`."""
+    if not inspect.isawaitable(result):
+        return result
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_awaited(result))
+    # kickoff_async() and Flows run tools while an event loop is already
+    # running, where asyncio.run() refuses to start; use a helper thread's loop.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _awaited(result)).result()
+
+
+class InProcessTool(BaseTool):
+    """A CrewAI tool that calls a FastMCP tool function directly."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    description: str
+    args_schema: Type[BaseModel]
+    server: Any
+    server_tool: Any
+
+    def _run(self, **kwargs: Any) -> Any:
+        tool = self.server_tool
+        arguments = {k: v for k, v in kwargs.items() if v is not None}
+        try:
+            metadata = tool.fn_metadata
+            parsed = metadata.arg_model.model_validate(metadata.pre_parse_json(arguments)).model_dump_one_level()
+            if tool.context_kwarg:
+                parsed[tool.context_kwarg] = self.server.get_context()
+            result = _resolve(tool.fn(**parsed))
+        except Exception as e:
+            # Same text the StdIO transport returns for a failed tool call.
+            return f"Error executing tool {self.name}: {e}"
+        return _to_text(result)
+
+
+def in_process_tools(server: Any) -> List[BaseTool]:
+    """Build CrewAI tools for every tool registered on a FastMCP server."""
+    return [
+        InProcessTool(
+            name=tool.name,
+            description=tool.description or "",
+            args_schema=tool.fn_metadata.arg_model,
+            server=server,
+            server_tool=tool,
+        )
+        for tool in server._tool_manager.list_tools()
+    ]
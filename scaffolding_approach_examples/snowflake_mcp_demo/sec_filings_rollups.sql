@@ -0,0 +1,58 @@
+-- Pre-aggregated SEC filing counts for the sec_filings_analytics service.
+--
+-- Filing-frequency and regulatory-event questions otherwise aggregate
+-- SEC_FILINGS_TEXT (372k filings, full text) on every call. This dynamic table
+-- keeps columnar counts by company x filing type x period x risk category and
+-- refreshes incrementally as new filings land, so those questions read a few
+-- thousand small rows instead of scanning filing content.
+--
+-- The CASE expressions match the filing_type and risk_category dimensions in
+-- sec_filings_semantic_model.yaml; keep them in sync when editing either file.
+--
+-- Run once in Snowsight (or with `snow sql -f sec_filings_rollups.sql`), then
+-- re-upload the semantic model to @MCP_DEMO.PUBLIC.semantic_models.
+
+USE DATABASE MCP_DEMO;
+USE SCHEMA PUBLIC;
+
+-- Incremental refresh only processes changed rows of the base table.
+ALTER TABLE SEC_FILINGS_TEXT SET CHANGE_TRACKING = TRUE;
+
+CREATE OR REPLACE DYNAMIC TABLE SEC_FILINGS_ROLLUP
+  TARGET_LAG = '1 hour'
+  WAREHOUSE = COMPUTE_WH  -- Replace with the warehouse used by your MCP demo
+  REFRESH_MODE = INCREMENTAL
+  CLUSTER BY (CIK, FILING_YEAR)
+  COMMENT = 'Filing counts by company, filing type, quarter and risk category for sec_filings_analytics'
+AS
+SELECT
+    CIK,
+    CASE
+        WHEN SEC_DOCUMENT_ID LIKE '%_10-K%' THEN '10-K'
+        WHEN SEC_DOCUMENT_ID LIKE '%_10-Q%' THEN '10-Q'
+        WHEN SEC_DOCUMENT_ID LIKE '%_8-K%' THEN '8-K'
+        WHEN SEC_DOCUMENT_ID LIKE '%_DEF%' THEN 'DEF-14A'
+        WHEN SEC_DOCUMENT_ID LIKE '%_S-%' THEN 'Registration'
+        ELSE 'Other'
+    END AS FILING_TYPE,
+    YEAR(PERIOD_END_DATE) AS FILING_YEAR,
+    QUARTER(PERIOD_END_DATE) AS FILING_QUARTER,
+    CASE
+        WHEN UPPER(FILING_CONTENT) LIKE '%CYBERSECURITY%' OR UPPER(FILING_CONTENT) LIKE '%DATA BREACH%' OR UPPER(FILING_CONTENT) LIKE '%CYBER%' THEN 'Technology/Cybersecurity'
+        WHEN UPPER(FILING_CONTENT) LIKE '%FDA%' OR UPPER(FILING_CONTENT) LIKE '%DRUG%' OR UPPER(FILING_CONTENT) LIKE '%CLINICAL%' OR UPPER(FILING_CONTENT) LIKE '%MEDICAL%' THEN 'Healthcare/Life Sciences'
+        WHEN UPPER(FILING_CONTENT) LIKE '%ENVIRONMENTAL%' OR UPPER(FILING_CONTENT) LIKE '%EPA%' OR UPPER(FILING_CONTENT) LIKE '%CLIMATE%' OR UPPER(FILING_CONTENT) LIKE '%CARBON%' THEN 'Environmental/ESG'
+        WHEN UPPER(FILING_CONTENT) LIKE '%FINANCIAL%' OR UPPER(FILING_CONTENT) LIKE '%BANKING%' OR UPPER(FILING_CONTENT) LIKE '%FINTECH%' OR UPPER(FILING_CONTENT) LIKE '%SECURITIES%' THEN 'Financial Services'
+        WHEN UPPER(FILING_CONTENT) LIKE '%ENERGY%' OR UPPER(FILING_CONTENT) LIKE '%OIL%' OR UPPER(FILING_CONTENT) LIKE '%GAS%' OR UPPER(FILING_CONTENT) LIKE '%RENEWABLE%' THEN 'Energy/Utilities'
+        WHEN UPPER(FILING_CONTENT) LIKE '%MANUFACTURING%' OR UPPER(FILING_CONTENT) LIKE '%SUPPLY CHAIN%' OR UPPER(FILING_CONTENT) LIKE '%INDUSTRIAL%' THEN 'Manufacturing/Industrial'
+        WHEN UPPER(FILING_CONTENT) LIKE '%REGULATORY%' OR UPPER(FILING_CONTENT) LIKE '%COMPLIANCE%' THEN 'General Regulatory'
+        ELSE 'Other'
+    END AS RISK_CATEGORY,
+    COUNT(*) AS FILING_COUNT,
+    SUM(IFF(SEC_DOCUMENT_ID LIKE '%_8-K%', 1, 0)) AS REGULATORY_EVENT_COUNT,
+    SUM(IFF(UPPER(FILING_CONTENT) LIKE '%RISK%' OR UPPER(FILING_CONTENT) LIKE '%REGULATORY%', 1, 0)) AS RISK_MENTION_COUNT,
+    SUM(LENGTH(FILING_CONTENT)) AS TOTAL_CONTENT_LENGTH
+FROM SEC_FILINGS_TEXT
+GROUP BY 1, 2, 3, 4, 5;
+
+-- Build the first version now instead of waiting for the target lag.
+ALTER DYNAMIC TABLE SEC_FILINGS_ROLLUP REFRESH;
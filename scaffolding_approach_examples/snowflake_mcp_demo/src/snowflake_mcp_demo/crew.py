@@ -4,6 +4,7 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai_tools import SerperDevTool
+from snowflake_mcp_demo.tools.coalescing import coalesce
 from mcp import StdioServerParameters
 from typing import List
 from pathlib import Path
@@ -57,7 +58,8 @@ class SnowflakeMcpDemo():
         return Agent(
             config=self.agents_config['portfolio_sec_analyst'], 
             verbose=True,
-            tools=self.get_mcp_tools()
+            # The Snowflake tools have no deadline of their own, so bound how long coalesced callers wait
+            tools=coalesce(self.get_mcp_tools(), server="snowflake", wait_timeout=180)
         )
 
     @agent
@@ -22,6 +22,7 @@ import warnings
 from datetime import datetime
 
 from snowflake_mcp_demo.crew import SnowflakeMcpDemo
+from snowflake_mcp_demo.tools.coalescing import default_group
 
 # Suppress various deprecation warnings
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -82,6 +83,7 @@ def run():
         
         print("\n" + "=" * 50)
         print("✅ Regulatory monitoring analysis complete!")
+        print(f"🔁 MCP calls: {default_group.stats()}")
         print("=" * 50)
         
         return result
@@ -0,0 +1,134 @@
+"""Request coalescing for MCP tools: identical concurrent calls share one request.
+
+The Context7 scaffold keeps a copy in `crewai_context7_mcp/tools/coalescing.py`;
+mirror changes made here.
+"""
+
+import json
+import threading
+from typing import Any, Callable, List, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, ConfigDict
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class CoalescedCallError(Exception):
+    """Raised in followers when the shared call failed; chained to the leader's error."""
+
+
+class SingleFlight:
+    """Collapses identical in-flight calls into one upstream request.
+
+    The first caller for a key runs the request; callers that arrive while it
+    is still running wait for it and share its result. If it fails, each
+    follower raises its own `CoalescedCallError` chained to the leader's error.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.calls = 0
+        self.upstream = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any], wait_timeout: float | None = None) -> Any:
+        """Run `fn` once per in-flight `key`.
+
+        `wait_timeout` bounds how long a follower waits for the leader; the
+        leader itself is not interrupted.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.upstream += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(wait_timeout):
+                raise TimeoutError(f"Gave up after {wait_timeout}s waiting for an identical in-flight call")
+            if call.error is not None:
+                raise CoalescedCallError(f"Shared call failed: {call.error}") from call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "upstream": self.upstream,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+# Shared by every crew in the process so concurrent crews coalesce too.
+default_group = SingleFlight()
+
+
+def call_key(server: str, tool: str, args: dict[str, Any]) -> str:
+    """Normalize a tool call so equivalent argument dicts map to the same key."""
+    normalized = {k: v for k, v in args.items() if v is not None}
+    return json.dumps([server, tool, normalized], sort_keys=True, default=str)
+
+
+class CoalescingTool(BaseTool):
+    """Wraps an MCP tool so identical concurrent calls share one request."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    description: str
+    args_schema: Type[BaseModel]
+    tool: BaseTool
+    server: str = ""
+    group: SingleFlight = default_group
+    wait_timeout: float | None = None
+
+    def _run(self, **kwargs: Any) -> Any:
+        return self.group.do(
+            call_key(self.server, self.name, kwargs), lambda: self.tool.run(**kwargs), self.wait_timeout
+        )
+
+
+def coalesce(
+    tools: List[BaseTool], server: str, group: SingleFlight | None = None, wait_timeout: float | None = None
+) -> List[BaseTool]:
+    """Wrap `tools` from one MCP server with request coalescing.
+
+    Set `wait_timeout` when the tools have no deadline of their own, so a hung
+    call cannot block every caller that joined it.
+    """
+    return [
+        CoalescingTool(
+            name=tool.name,
+            # BaseTool prefixes the name and arguments onto the description; keep only the original text.
+            description=tool.description.split("Tool Description: ", 1)[-1],
+            args_schema=tool.args_schema,
+            tool=tool,
+            server=server,
+            group=group or default_group,
+            wait_timeout=wait_timeout,
+        )
+        for tool in tools
+    ]
@@ -0,0 +1,239 @@
+"""A bounded, disk-backed storage backend for CrewAI memory.
+
+CrewAI's default short-term and entity memory keep every item forever, which
+makes resident memory grow without limit in long-running workers. This backend
+caps the store by entry count, total bytes and age, evicting the least recently
+used entries first. Vectors live in a fixed-size memory-mapped file and text and
+metadata live in SQLite, so resident memory stays flat however long the worker
+runs.
+
+Entries are embedded with the same embedding function CrewAI memory uses
+(`crewai_embedder`, OpenAI `text-embedding-3-small` unless the crew configures
+another one), so retrieval quality matches the default store. For offline runs,
+pass `embedder=hashing_embedder(256)`: it needs no API, but matching becomes
+lexical, so paraphrased recalls score well below `score_threshold`.
+
+Usage:
+
+    from crewai.memory.short_term.short_term_memory import ShortTermMemory
+    from bounded_memory import BoundedMemoryStorage
+
+    crew = Crew(
+        ...,
+        memory=True,
+        short_term_memory=ShortTermMemory(storage=BoundedMemoryStorage("memory/short_term")),
+    )
+"""
+
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def crewai_embedder(embedder_config: dict[str, Any] | None = None) -> Callable[[str], np.ndarray]:
+    """The embedding function CrewAI memory uses for `embedder_config`.
+
+    Pass the same dict as `Crew(embedder=...)`; `None` selects CrewAI's default.
+    Vectors are L2-normalised so search scores are cosine similarities.
+    """
+    from crewai.utilities.embedding_configurator import EmbeddingConfigurator
+
+    function = EmbeddingConfigurator().configure_embedder(embedder_config)
+
+    def embed(text: str) -> np.ndarray:
+        vector = np.asarray(function([text])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    return embed
+
+
+def hashing_embedder(dim: int) -> Callable[[str], np.ndarray]:
+    """Dependency-free bag-of-words embedder using signed feature hashing.
+
+    An offline fallback only: it matches shared words, not meaning.
+    """
+    def embed(text: str) -> np.ndarray:
+        vector = np.zeros(dim, dtype=np.float32)
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            h = zlib.crc32(token.encode())
+            vector[h % dim] += 1.0 if h & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    return embed
+
+
+class BoundedMemoryStorage:
+    """Size-capped memory storage with LRU/age eviction and an mmap vector store.
+
+    Implements the `save` / `search` / `reset` interface CrewAI expects from a
+    memory storage, so it can be passed as `storage=` to `ShortTermMemory` or
+    `EntityMemory`.
+
+    `embedder` defaults to `crewai_embedder()`; `dim` defaults to the length of
+    its output.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "memory",
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age_seconds: float | None = None,
+        dim: int | None = None,
+        embedder: Callable[[str], np.ndarray] | None = None,
+    ):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.embed = embedder or crewai_embedder()
+        # Size the vector file to the embedder's output unless told otherwise.
+        self.dim = dim = dim or len(self.embed("dimension probe"))
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path / "entries.db", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "slot INTEGER PRIMARY KEY, context TEXT, metadata TEXT, "
+            "bytes INTEGER, created REAL, accessed REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+        self._db.commit()
+
+        vectors_file = self.path / "vectors.f32"
+        reuse = vectors_file.exists() and vectors_file.stat().st_size == max_entries * dim * 4
+        self._vectors = np.memmap(vectors_file, dtype=np.float32, mode="r+" if reuse else "w+", shape=(max_entries, dim))
+        if not reuse:
+            # A new vector file (first run, or max_entries/dim changed) has no
+            # vectors for existing rows, so drop them rather than keep dead entries.
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+
+        self._occupied = np.zeros(max_entries, dtype=bool)
+        slots = [row[0] for row in self._db.execute("SELECT slot FROM entries WHERE slot < ?", (max_entries,))]
+        self._occupied[slots] = True
+        self._db.execute("DELETE FROM entries WHERE slot >= ?", (max_entries,))
+        self._bytes = self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()[0]
+
+        self._evictions = 0
+        self._retrievals = 0
+        self._retrieval_latencies: deque[float] = deque(maxlen=1024)
+
+    # -- CrewAI storage interface -------------------------------------------
+
+    def save(self, value: Any, metadata: dict[str, Any] | None = None) -> None:
+        context = value if isinstance(value, str) else json.dumps(value, default=str)
+        meta = json.dumps(metadata or {}, default=str)
+        size = len(context.encode()) + len(meta.encode()) + self.dim * 4
+        vector = self.embed(context)
+        now = time.time()
+
+        with self._lock:
+            self._evict(now, incoming_bytes=size)
+            slot = int(np.argmin(self._occupied))
+            self._vectors[slot] = vector
+            self._occupied[slot] = True
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (slot, context, meta, size, now, now),
+            )
+            self._db.commit()
+            self._bytes += size
+
+    def search(self, query: str, limit: int = 3, score_threshold: float = 0.35) -> list[dict[str, Any]]:
+        start = time.perf_counter()
+        q = self.embed(query)
+
+        with self._lock:
+            self._evict(time.time())
+            slots = np.flatnonzero(self._occupied)
+            results = []
+            if len(slots):
+                scores = np.asarray(self._vectors[slots] @ q)
+                order = np.argsort(-scores)[:limit]
+                hits = [(int(slots[i]), float(scores[i])) for i in order if scores[i] >= score_threshold]
+                now = time.time()
+                for slot, score in hits:
+                    context, meta = self._db.execute(
+                        "SELECT context, metadata FROM entries WHERE slot = ?", (slot,)
+                    ).fetchone()
+                    results.append({"id": str(slot), "context": context, "metadata": json.loads(meta), "score": score})
+                self._db.executemany("UPDATE entries SET accessed = ? WHERE slot = ?", [(now, s) for s, _ in hits])
+                self._db.commit()
+
+            self._retrievals += 1
+            self._retrieval_latencies.append(time.perf_counter() - start)
+        return results
+
+    def reset(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+            self._occupied[:] = False
+            self._bytes = 0
+
+    # -- Eviction and metrics -----------------------------------------------
+
+    def _evict(self, now: float, incoming_bytes: int = 0) -> None:
+        """Drop expired entries, then LRU entries until the new item fits."""
+        evicted = []
+        if self.max_age_seconds is not None:
+            evicted += self._db.execute(
+                "SELECT slot, bytes FROM entries WHERE created < ?", (now - self.max_age_seconds,)
+            ).fetchall()
+
+        lru = self._db.execute("SELECT slot, bytes FROM entries ORDER BY accessed")
+        entries = int(self._occupied.sum()) - len(evicted)
+        size = self._bytes - sum(b for _, b in evicted)
+        incoming = 1 if incoming_bytes else 0
+        expired = {slot for slot, _ in evicted}
+        while entries + incoming > self.max_entries or (incoming and entries and size + incoming_bytes > self.max_bytes):
+            row = lru.fetchone()
+            if row is None:
+                break
+            if row[0] in expired:
+                continue
+            evicted.append(row)
+            entries -= 1
+            size -= row[1]
+
+        if evicted:
+            self._db.executemany("DELETE FROM entries WHERE slot = ?", [(slot,) for slot, _ in evicted])
+            self._db.commit()
+            for slot, b in evicted:
+                self._occupied[slot] = False
+                self._bytes -= b
+            self._evictions += len(evicted)
+
+    def stats(self) -> dict[str, Any]:
+        """Entries, bytes, evictions and retrieval latency for monitoring."""
+        with self._lock:
+            latencies = sorted(self._retrieval_latencies)
+            p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)] if latencies else 0.0
+            return {
+                "entries": int(self._occupied.sum()),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "retrievals": self._retrievals,
+                "retrieval_latency_mean_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                "retrieval_latency_p95_ms": 1000 * p95,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._vectors.flush()
+            self._db.close()
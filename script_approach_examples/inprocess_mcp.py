@@ -0,0 +1,184 @@
+"""Mount a local FastMCP server in the client process.
+
+Local Python MCP servers such as `servers/math_stdio_server.py` normally run in
+their own `python3` process, so every tool call pays for JSON-RPC serialization
+and a pipe round trip. `InProcessServerAdapter` imports the FastMCP server
+object instead and calls its tools directly, keeping the same tool names,
+argument schemas and error text as the StdIO transport.
+
+Usage (a drop-in for `MCPServerAdapter`):
+
+    with InProcessServerAdapter("servers/math_stdio_server.py:mcp") as tools:
+        ...
+
+Pass `in_process=False` (or set `MCP_IN_PROCESS=false`) to run the same server
+over StdIO in a separate process when isolation matters more than latency.
+
+The Mathematician scaffold keeps a copy of the tool-building half in
+`mathematician_project/tools/inprocess.py`; mirror changes made here.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import inspect
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Type
+
+import pydantic_core
+from crewai.tools import BaseTool
+from crewai_tools import MCPServerAdapter
+from mcp import StdioServerParameters
+from pydantic import BaseModel, ConfigDict
+
+
+def in_process_enabled() -> bool:
+    """In-process mounting is on unless `MCP_IN_PROCESS` is set to a false value."""
+    return os.getenv("MCP_IN_PROCESS", "true").lower() not in ("0", "false", "no")
+
+
+def load_server(import_path: str) -> Any:
+    """Load a FastMCP object from `package.module:attr` or `path/to/file.py:attr`.
+
+    The attribute defaults to `mcp`, the name used by the servers in this repo.
+    """
+    target, _, attr = import_path.partition(":")
+    if target.endswith(".py"):
+        path = Path(target).resolve()
+        module_name = path.stem
+        module = sys.modules.get(module_name)
+        if module is None or getattr(module, "__file__", None) != str(path):
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            module = importlib.util.module_from_spec(spec)
+            # Let the server import its sibling modules, as `python3 path/to/file.py`
+            # would, but only while it loads: the servers directory must neither
+            # shadow client modules nor be shadowed by them. Sibling helpers use
+            # `mcp_`-prefixed names to stay clear of client module names.
+            sys.path.insert(0, str(path.parent))
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                sys.path.remove(str(path.parent))
+            sys.modules[module_name] = module
+    else:
+        module = importlib.import_module(target)
+    return getattr(module, attr or "mcp")
+
+
+def _to_text(result: Any) -> str:
+    """Convert a tool's return value the way FastMCP does for text content."""
+    if isinstance(result, str):
+        return result
+    return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+
+
+async def _awaited(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _resolve(result: Any) -> Any:
+    """Wait for an async tool's result from synchronous `_run`."""
+    if not inspect.isawaitable(result):
+        return result
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_awaited(result))
+    # kickoff_async() and Flows run tools while an event loop is already
+    # running, where asyncio.run() refuses to start; use a helper thread's loop.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _awaited(result)).result()
+
+
+class InProcessTool(BaseTool):
+    """A CrewAI tool that calls a FastMCP tool function directly."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    description: str
+    args_schema: Type[BaseModel]
+    server: Any
+    server_tool: Any
+
+    def _run(self, **kwargs: Any) -> Any:
+        tool = self.server_tool
+        arguments = {k: v for k, v in kwargs.items() if v is not None}
+        try:
+            metadata = tool.fn_metadata
+            parsed = metadata.arg_model.model_validate(metadata.pre_parse_json(arguments)).model_dump_one_level()
+            if tool.context_kwarg:
+                parsed[tool.context_kwarg] = self.server.get_context()
+            result = _resolve(tool.fn(**parsed))
+        except Exception as e:
+            # Same text the StdIO transport returns for a failed tool call.
+            return f"Error executing tool {self.name}: {e}"
+        return _to_text(result)
+
+
+def in_process_tools(server: Any) -> List[BaseTool]:
+    """Build CrewAI tools for every tool registered on a FastMCP server."""
+    return [
+        InProcessTool(
+            name=tool.name,
+            description=tool.description or "",
+            args_schema=tool.fn_metadata.arg_model,
+            server=server,
+            server_tool=tool,
+        )
+        for tool in server._tool_manager.list_tools()
+    ]
+
+
+class InProcessServerAdapter:
+    """Context manager with the same shape as `MCPServerAdapter`.
+
+    Mounts the FastMCP server at `import_path` in-process by default; with
+    `in_process=False` it starts the server file over StdIO instead.
+    """
+
+    def __init__(self, import_path: str, *tool_names: str, in_process: bool | None = None):
+        if in_process is None:
+            in_process = in_process_enabled()
+        self.import_path = import_path
+        self.tool_names = tool_names
+        self.in_process = in_process
+        self._adapter: MCPServerAdapter | None = None
+        self._tools: List[BaseTool] = []
+
+    def start(self) -> None:
+        if self.in_process:
+            self._tools = in_process_tools(load_server(self.import_path))
+        else:
+            target = self.import_path.partition(":")[0]
+            if not target.endswith(".py"):
+                target = importlib.util.find_spec(target).origin
+            self._adapter = MCPServerAdapter(
+                StdioServerParameters(
+                    command=sys.executable,
+                    args=[target],
+                    env={"UV_PYTHON": "3.12", **os.environ},
+                )
+            )
+            self._tools = list(self._adapter.tools)
+        if self.tool_names:
+            self._tools = [tool for tool in self._tools if tool.name in self.tool_names]
+
+    def stop(self) -> None:
+        if self._adapter is not None:
+            self._adapter.stop()
+            self._adapter = None
+
+    @property
+    def tools(self) -> List[BaseTool]:
+        return self._tools
+
+    def __enter__(self) -> List[BaseTool]:
+        self.start()
+        return self.tools
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -1,7 +1,8 @@
 from crewai import Agent, Task, Crew
-from crewai_tools import MCPServerAdapter
 from mcp import StdioServerParameters
 
+from deadline_mcp import DeadlineServerAdapter
+
 import os
 
 server_configurations = [
@@ -22,7 +23,17 @@ server_configurations = [
     )
 ]
 
-with MCPServerAdapter(server_configurations) as tools:
+# Local tools answer in milliseconds; give the remote docs search a longer budget.
+# The docs task is also held to its agent's max_execution_time across all calls
+with DeadlineServerAdapter(
+    server_configurations,
+    tool_timeout=10,
+    task_budgets=True,
+    tool_timeouts={"search_cloudflare_documentation": 60},
+    hedge_tools={"search_cloudflare_documentation"},
+    hedge_min_samples=5,
+    hedge_initial_delay=10,
+) as tools:
     print("Available MCP Tools:", [tool.name for tool in tools])
 
     hello_agent = Agent(
@@ -52,6 +63,7 @@ with MCPServerAdapter(server_configurations) as tools:
         tools=tools,
         reasoning=True,
         reasoning_steps=2,
+        max_execution_time=300,
         verbose=True
     )
 
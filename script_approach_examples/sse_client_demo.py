@@ -1,11 +1,30 @@
 from crewai import Agent, Task, Crew
-from crewai_tools import MCPServerAdapter
+from crewai.memory import EntityMemory, ShortTermMemory
+
+from bounded_memory import BoundedMemoryStorage, crewai_embedder
+from deadline_mcp import DeadlineServerAdapter
 
 # Create a SSEServerParameters object
 server_params = {"url": "https://docs.mcp.cloudflare.com/sse"}
 
-# Use the SSEServerParameters object to create a MCPServerAdapter
-with MCPServerAdapter(server_params) as tools:
+# Cap agent memory so long-running sessions don't grow without limit. Both
+# stores embed with the crew's embedder (CrewAI's default here); pass the same
+# dict as Crew(embedder=...) to crewai_embedder() if you configure one
+embedder = crewai_embedder()
+short_term_storage = BoundedMemoryStorage("memory/short_term", max_entries=5_000, max_age_seconds=24 * 3600, embedder=embedder)
+entity_storage = BoundedMemoryStorage("memory/entities", max_entries=5_000, embedder=embedder)
+
+# Give every tool call a time budget so a stalled request can't hang the crew,
+# cap calls at the agent's max_execution_time for the task as a whole, and
+# hedge slow documentation searches once we have a latency baseline
+with DeadlineServerAdapter(
+    server_params,
+    tool_timeout=60,
+    task_budgets=True,
+    hedge_tools={"search_cloudflare_documentation"},
+    hedge_min_samples=5,
+    hedge_initial_delay=10,
+) as tools:
     print("Available MCP Tools:", [tool.name for tool in tools])
 
     doc_agent = Agent(
@@ -16,6 +35,7 @@ with MCPServerAdapter(server_params) as tools:
         reasoning=True,
         reasoning_steps=2,
         memory=True,
+        max_execution_time=300,
         verbose=True
     )
 
@@ -30,8 +50,12 @@ with MCPServerAdapter(server_params) as tools:
     crew = Crew(
         agents=[doc_agent],
         tasks=[doc_task],
+        memory=True,
+        short_term_memory=ShortTermMemory(storage=short_term_storage),
+        entity_memory=EntityMemory(storage=entity_storage),
         verbose=True,
     )
 
     result = crew.kickoff(inputs={"question": input("Cloudflare docs, how may I help you? ") })
-    print("\nFinal Output:\n", result)
\ No newline at end of file
+    print("\nFinal Output:\n", result)
+    print("Memory stats:", {"short_term": short_term_storage.stats(), "entities": entity_storage.stats()})
\ No newline at end of file
@@ -1,8 +1,18 @@
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from mcp_instrumentation import ToolMetrics
 
 mcp = FastMCP("Hello")
+metrics = ToolMetrics("hello")
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
 
 @mcp.tool()
+@metrics.track
 def hello(name: str) -> str:
     """Say hello to the user"""
     return f"Hello, {name}!"
@@ -5,24 +5,31 @@ This server provides mathematical operations as tools that can be discovered and
 
 from mcp.server.fastmcp import FastMCP
 
+from mcp_instrumentation import ToolMetrics
+
 mcp = FastMCP("Math")
+metrics = ToolMetrics("math")
 
 @mcp.tool()
+@metrics.track
 def add(a: float, b: float) -> float:
     """Add two numbers (ints or floats)"""
     return a + b
 
 @mcp.tool()
+@metrics.track
 def subtract(a: float, b: float) -> float:
     """Subtract b from a (ints or floats)"""
     return a - b
 
 @mcp.tool()
+@metrics.track
 def multiply(a: float, b: float) -> float:
     """Multiply two numbers (ints or floats)"""
     return a * b
 
 @mcp.tool()
+@metrics.track
 def divide(numerator: float, denominator: float) -> float:
     """Divide numerator by denominator (floats ok)"""
     if denominator == 0:
@@ -30,17 +37,24 @@ def divide(numerator: float, denominator: float) -> float:
     return numerator / denominator
 
 @mcp.tool()
+@metrics.track
 def power(base: float, exponent: float) -> float:
     """Raise base to the power of exponent (floats ok)"""
     return base ** exponent
 
 @mcp.tool()
+@metrics.track
 def sqrt(number: float) -> float:
     """Calculate the square root of a number"""
     if number < 0:
         raise ValueError("Cannot calculate square root of a negative number")
     return number ** 0.5
 
+@mcp.tool()
+def server_stats() -> dict:
+    """Per-tool call counts, error counts, in-flight calls and latency percentiles measured inside this server"""
+    return metrics.snapshot()
+
 if __name__ == "__main__":
     mcp.run(transport="stdio")
 
@@ -0,0 +1,171 @@
+"""Low-overhead per-tool metrics for the FastMCP servers.
+
+Wrap each tool with `metrics.track` (below `@mcp.tool()`) to record call and
+error counts, a latency histogram and an in-flight gauge. Recording costs two
+`perf_counter()` calls, a bisect and a short lock, so it is cheap enough to
+leave on in production.
+
+    metrics = ToolMetrics("math")
+
+    @mcp.tool()
+    @metrics.track
+    def add(a: float, b: float) -> float:
+        ...
+
+Only the decorated function body is measured. FastMCP parses and validates
+arguments before calling it and serializes the result afterwards, so that time
+is excluded, and calls rejected by argument validation are not recorded.
+
+`render_prometheus()` produces the Prometheus text format for an HTTP
+`/metrics` endpoint; `snapshot()` returns the same data as a dict, for example
+from a `server_stats` tool on StdIO servers.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable
+
+# Upper bounds in seconds; tool calls range from microseconds (local math) to
+# seconds (remote lookups). The implicit last bucket is +Inf.
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _ToolStats:
+    __slots__ = ("calls", "errors", "in_flight", "latency_sum", "bucket_counts")
+
+    def __init__(self, buckets: int):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * (buckets + 1)
+
+
+class ToolMetrics:
+    """Call counts, error counts, latency histograms and in-flight gauges per tool."""
+
+    def __init__(self, server: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.server = server
+        self.buckets = buckets
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._tools: dict[str, _ToolStats] = {}
+
+    def _stats(self, tool: str) -> _ToolStats:
+        stats = self._tools.get(tool)
+        if stats is None:
+            with self._lock:
+                stats = self._tools.setdefault(tool, _ToolStats(len(self.buckets)))
+        return stats
+
+    def _begin(self, stats: _ToolStats) -> float:
+        with self._lock:
+            stats.in_flight += 1
+        return time.perf_counter()
+
+    def _end(self, stats: _ToolStats, start: float, failed: bool) -> None:
+        elapsed = time.perf_counter() - start
+        bucket = bisect_left(self.buckets, elapsed)
+        with self._lock:
+            stats.in_flight -= 1
+            stats.calls += 1
+            stats.errors += failed
+            stats.latency_sum += elapsed
+            stats.bucket_counts[bucket] += 1
+
+    def track(self, fn: Callable) -> Callable:
+        """Decorate a tool function; sync and async tools are both supported."""
+        stats = self._stats(fn.__name__)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = self._begin(stats)
+                failed = True
+                try:
+                    result = await fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    self._end(stats, start, failed)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = self._begin(stats)
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._end(stats, start, failed)
+        return wrapper
+
+    def _quantile(self, counts: list[int], calls: int, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket that contains it."""
+        if not calls:
+            return None
+        target, seen = q * calls, 0
+        for bound, count in zip(self.buckets, counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current counters per tool, with histogram-estimated latency percentiles."""
+        with self._lock:
+            tools = {
+                name: (s.calls, s.errors, s.in_flight, s.latency_sum, list(s.bucket_counts))
+                for name, s in self._tools.items()
+            }
+        result = {}
+        for name, (calls, errors, in_flight, latency_sum, counts) in tools.items():
+            # Percentiles are histogram bucket upper bounds, in milliseconds.
+            p50, p95, p99 = (self._quantile(counts, calls, q) for q in (0.5, 0.95, 0.99))
+            result[name] = {
+                "calls": calls,
+                "errors": errors,
+                "in_flight": in_flight,
+                "latency_mean_ms": 1000 * latency_sum / calls if calls else None,
+                "latency_p50_ms": 1000 * p50 if calls else None,
+                "latency_p95_ms": 1000 * p95 if calls else None,
+                "latency_p99_ms": 1000 * p99 if calls else None,
+            }
+        return {"server": self.server, "uptime_s": round(time.time() - self.started, 3), "tools": result}
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            tools = {
+                name: (s.calls, s.errors, s.in_flight, s.latency_sum, list(s.bucket_counts))
+                for name, s in self._tools.items()
+            }
+        server = self.server
+        lines = [
+            "# HELP mcp_tool_calls_total Completed tool calls that passed argument validation.",
+            "# TYPE mcp_tool_calls_total counter",
+            *(f'mcp_tool_calls_total{{server="{server}",tool="{n}"}} {t[0]}' for n, t in tools.items()),
+            "# HELP mcp_tool_errors_total Tool calls whose function raised; argument validation errors are excluded.",
+            "# TYPE mcp_tool_errors_total counter",
+            *(f'mcp_tool_errors_total{{server="{server}",tool="{n}"}} {t[1]}' for n, t in tools.items()),
+            "# HELP mcp_tool_in_flight Tool calls currently running.",
+            "# TYPE mcp_tool_in_flight gauge",
+            *(f'mcp_tool_in_flight{{server="{server}",tool="{n}"}} {t[2]}' for n, t in tools.items()),
+            "# HELP mcp_tool_duration_seconds Time spent in the tool function body, excluding argument parsing and result serialization.",
+            "# TYPE mcp_tool_duration_seconds histogram",
+        ]
+        for name, (calls, _, _, latency_sum, counts) in tools.items():
+            labels = f'server="{server}",tool="{name}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'mcp_tool_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'mcp_tool_duration_seconds_bucket{{{labels},le="+Inf"}} {calls}')
+            lines.append(f"mcp_tool_duration_seconds_sum{{{labels}}} {latency_sum}")
+            lines.append(f"mcp_tool_duration_seconds_count{{{labels}}} {calls}")
+        return "\n".join(lines) + "\n"